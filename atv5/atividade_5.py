@@ -1,3 +1,6 @@
+from collections import Counter
+
+
 class No:
     """
     Representa um nó na Árvore AVL.
@@ -255,6 +258,182 @@ class ArvoreAVL:
             nivel += 1
         return -1
 
+    # ===============================================================
+    # UTILITÁRIOS: PERCURSO E CARGA EM LOTE
+    # ===============================================================
+
+    def percurso_em_ordem(self):
+        """
+        Retorna a lista de todas as chaves da árvore em ordem crescente.
+        """
+        resultado = []
+        pilha = []
+        atual = self.raiz
+        while pilha or atual is not None:
+            while atual is not None:
+                pilha.append(atual)
+                atual = atual.esquerda
+            atual = pilha.pop()
+            resultado.append(atual.chave)
+            atual = atual.direita
+        return resultado
+
+    def carregar_ordenadas(self, chaves):
+        """
+        Substitui o conteúdo da árvore pelas chaves dadas, que devem estar em ordem
+        crescente e sem duplicatas. Monta a árvore já balanceada em tempo linear,
+        sem passar pelas rotações de `inserir`.
+        """
+        def construir(inicio, fim):
+            if inicio > fim:
+                return None
+            meio = (inicio + fim) // 2
+            no = No(chaves[meio])
+            no.esquerda = construir(inicio, meio - 1)
+            no.direita = construir(meio + 1, fim)
+            self._atualizar_altura(no)
+            return no
+
+        self.raiz = construir(0, len(chaves) - 1)
+
+
+class _ChaveContada:
+    """
+    Envolve uma chave e conta cada comparação feita com ela, inclusive as refletidas
+    (`no.chave > chave` cai em `chave.__lt__`). Se receber o conjunto `vistos`, também
+    guarda quais chaves da árvore foram comparadas, o que dá o número de nós visitados
+    numa busca.
+    """
+    __slots__ = ("valor", "_arvore", "vistos")
+
+    def __init__(self, valor, arvore, vistos=None):
+        self.valor = valor
+        self._arvore = arvore
+        self.vistos = vistos
+
+    def _outro(self, outro):
+        self._arvore._comparacoes += 1
+        if isinstance(outro, _ChaveContada):
+            outro = outro.valor
+        if self.vistos is not None:
+            self.vistos.add(id(outro))
+        return outro
+
+    def __lt__(self, outro):
+        return self.valor < self._outro(outro)
+
+    def __le__(self, outro):
+        return self.valor <= self._outro(outro)
+
+    def __gt__(self, outro):
+        return self.valor > self._outro(outro)
+
+    def __ge__(self, outro):
+        return self.valor >= self._outro(outro)
+
+    def __eq__(self, outro):
+        return self.valor == self._outro(outro)
+
+    def __ne__(self, outro):
+        return self.valor != self._outro(outro)
+
+    def __hash__(self):
+        return hash(self.valor)
+
+
+class ArvoreAVLInstrumentada(ArvoreAVL):
+    """
+    Árvore AVL com contadores de rotações, comparações de chave e comprimento
+    dos caminhos de descida. Os contadores ficam todos nesta subclasse: quem usa
+    a ArvoreAVL comum não paga nada por eles.
+
+    As comparações são contadas envolvendo a chave recebida num `_ChaveContada`
+    antes de repassá-la aos métodos da classe base, que continuam sendo os
+    únicos donos dos algoritmos de busca, inserção e deleção.
+    """
+    def __init__(self):
+        super().__init__()
+        self.resetar_contadores()
+
+    def resetar_contadores(self):
+        """Zera todos os contadores."""
+        self._rotacoes = {"direita": 0, "esquerda": 0}
+        self._comparacoes = 0
+        self._caminhos = {
+            "inserir": Counter(),
+            "deletar": Counter(),
+            "busca": Counter(),
+            "intervalo": Counter(),
+        }
+        self._passos = 0
+
+    def obter_contadores(self):
+        """
+        Retorna uma cópia dos contadores. `comparacoes` é o total de comparações
+        de chave (descida, balanceamento e buscas). Os histogramas mapeiam o número
+        de nós visitados para o número de operações: em "inserir", "deletar" e
+        "busca" é o comprimento da descida; em "intervalo" é o total de nós
+        visitados pelo percurso em ordem, não uma descida.
+        """
+        return {
+            "rotacoes": dict(self._rotacoes),
+            "comparacoes": self._comparacoes,
+            "caminhos": {op: dict(hist) for op, hist in self._caminhos.items()},
+        }
+
+    def _contada(self, chave, vistos=None):
+        if isinstance(chave, _ChaveContada):
+            return chave
+        return _ChaveContada(chave, self, vistos)
+
+    def _rotacao_direita(self, no_pivo):
+        self._rotacoes["direita"] += 1
+        return super()._rotacao_direita(no_pivo)
+
+    def _rotacao_esquerda(self, no_pivo):
+        self._rotacoes["esquerda"] += 1
+        return super()._rotacao_esquerda(no_pivo)
+
+    def inserir(self, chave):
+        self._passos = 0
+        try:
+            super().inserir(self._contada(chave))
+        finally:
+            self._caminhos["inserir"][self._passos] += 1
+
+    def _inserir_recursivo(self, no_atual, chave):
+        if no_atual is None:
+            # O nó guarda a chave original, nunca o envoltório.
+            return No(chave.valor if isinstance(chave, _ChaveContada) else chave)
+        self._passos += 1
+        return super()._inserir_recursivo(no_atual, self._contada(chave))
+
+    def deletar(self, chave):
+        self._passos = 0
+        try:
+            super().deletar(self._contada(chave))
+        finally:
+            self._caminhos["deletar"][self._passos] += 1
+
+    def _deletar_recursivo(self, no_atual, chave):
+        # Inclui a descida extra até o sucessor no caso de nó com dois filhos;
+        # a chave do sucessor chega sem envoltório e é envolvida aqui.
+        if no_atual is not None:
+            self._passos += 1
+        return super()._deletar_recursivo(no_atual, self._contada(chave))
+
+    def encontrar_nos_intervalo(self, chave1, chave2):
+        vistos = set()
+        resultado = super().encontrar_nos_intervalo(self._contada(chave1, vistos), self._contada(chave2, vistos))
+        self._caminhos["intervalo"][len(vistos)] += 1
+        return resultado
+
+    def obter_profundidade_no(self, chave):
+        vistos = set()
+        nivel = super().obter_profundidade_no(self._contada(chave, vistos))
+        self._caminhos["busca"][len(vistos)] += 1
+        return nivel
+
 # --- Bloco de Teste e Demonstração da Atividade AVL ---
 if __name__ == "__main__":
     arvore_avl = ArvoreAVL()
@@ -302,3 +481,17 @@ if __name__ == "__main__":
             print("Método `obter_profundidade_no` ainda não implementado.")
     except Exception as e:
         print(f"\nERRO DURANTE O CÁLCULO DE PROFUNDIDADE: {e}")
+
+    print("\n--- 5. Contadores de instrumentação ---")
+    arvore_instrumentada = ArvoreAVLInstrumentada()
+    for chave in chaves_para_inserir:
+        arvore_instrumentada.inserir(chave)
+    for chave in chaves_para_deletar:
+        arvore_instrumentada.deletar(chave)
+    arvore_instrumentada.encontrar_nos_intervalo(1, 9)
+    arvore_instrumentada.obter_profundidade_no(6)
+    contadores = arvore_instrumentada.obter_contadores()
+    print(f"Rotações: {contadores['rotacoes']}")
+    print(f"Comparações: {contadores['comparacoes']}")
+    for operacao, histograma in contadores["caminhos"].items():
+        print(f"Caminhos ({operacao}): {dict(sorted(histograma.items()))}")
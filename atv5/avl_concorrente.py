@@ -0,0 +1,303 @@
+import asyncio
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future
+
+from atividade_5 import ArvoreAVL
+
+
+class TravaLeituraEscrita:
+    """
+    Trava de leitura/escrita: vários leitores ao mesmo tempo ou um único escritor.
+    Dá preferência ao escritor para que um fluxo contínuo de leituras não o deixe esperando para sempre.
+    """
+    def __init__(self):
+        self._condicao = threading.Condition()
+        self._leitores = 0
+        self._escrevendo = False
+        self._escritores_esperando = 0
+
+    def adquirir_leitura(self):
+        with self._condicao:
+            while self._escrevendo or self._escritores_esperando:
+                self._condicao.wait()
+            self._leitores += 1
+
+    def liberar_leitura(self):
+        with self._condicao:
+            self._leitores -= 1
+            if self._leitores == 0:
+                self._condicao.notify_all()
+
+    def adquirir_escrita(self):
+        with self._condicao:
+            self._escritores_esperando += 1
+            while self._escrevendo or self._leitores:
+                self._condicao.wait()
+            self._escritores_esperando -= 1
+            self._escrevendo = True
+
+    def liberar_escrita(self):
+        with self._condicao:
+            self._escrevendo = False
+            self._condicao.notify_all()
+
+
+class ArvoreAVLConcorrente:
+    """
+    Envolve uma ArvoreAVL para uso compartilhado entre threads.
+    Leituras rodam em paralelo sob a trava de leitura; escritas entram numa fila
+    que uma única thread escritora esvazia em lotes ordenados pela chave.
+    """
+    _FIM = object()
+
+    def __init__(self, arvore=None, tamanho_lote=64):
+        self.arvore = arvore if arvore is not None else ArvoreAVL()
+        self.tamanho_lote = tamanho_lote
+        self._trava = TravaLeituraEscrita()
+        self._fila = queue.Queue()
+        self._trava_fila = threading.Lock()
+        self._fechada = False
+        self._escritor = threading.Thread(target=self._laco_escritor, daemon=True)
+        self._escritor.start()
+
+    # Escritas --------------------------
+
+    def inserir(self, chave):
+        """Enfileira a inserção e retorna um Future concluído quando ela for aplicada."""
+        return self._enfileirar("inserir", chave)
+
+    def deletar(self, chave):
+        """Enfileira a deleção e retorna um Future concluído quando ela for aplicada."""
+        return self._enfileirar("deletar", chave)
+
+    def _enfileirar(self, operacao, chave):
+        futuro = Future()
+        # A trava garante que nenhuma escrita entre na fila depois do sinal de término.
+        with self._trava_fila:
+            if self._fechada:
+                raise RuntimeError("ArvoreAVLConcorrente já foi fechada.")
+            self._fila.put((operacao, chave, futuro))
+        return futuro
+
+    def _laco_escritor(self):
+        while True:
+            item = self._fila.get()
+            if item is self._FIM:
+                self._fila.task_done()
+                return
+            lote = [item]
+            while len(lote) < self.tamanho_lote:
+                try:
+                    item = self._fila.get_nowait()
+                except queue.Empty:
+                    break
+                if item is self._FIM:
+                    # Devolve o sinal de término para ser tratado depois do lote atual.
+                    self._fila.task_done()
+                    self._fila.put(item)
+                    break
+                lote.append(item)
+            try:
+                self._aplicar_lote(lote)
+            except Exception as e:
+                # Falha fora de uma operação específica: o lote inteiro recebe o erro,
+                # mas a thread escritora continua viva para os próximos lotes.
+                for _, _, futuro in lote:
+                    if not futuro.done():
+                        futuro.set_exception(e)
+            finally:
+                for _ in lote:
+                    self._fila.task_done()
+
+    def _aplicar_lote(self, lote):
+        # A ordenação é estável: operações sobre a mesma chave mantêm a ordem de chegada.
+        # Se houver chaves incomparáveis no lote, aplica na ordem de chegada e deixa
+        # a própria árvore rejeitar a operação inválida. Ordena uma cópia porque um
+        # sort que falha no meio deixa a lista parcialmente reordenada.
+        try:
+            ordenado = sorted(lote, key=lambda item: item[1])
+        except TypeError:
+            ordenado = lote
+        resultados = []
+        self._trava.adquirir_escrita()
+        try:
+            for operacao, chave, futuro in ordenado:
+                try:
+                    getattr(self.arvore, operacao)(chave)
+                    resultados.append((futuro, None))
+                except Exception as e:
+                    resultados.append((futuro, e))
+        finally:
+            self._trava.liberar_escrita()
+        for futuro, erro in resultados:
+            if futuro.done():
+                continue
+            if erro is None:
+                futuro.set_result(None)
+            else:
+                futuro.set_exception(erro)
+
+    def descarregar(self):
+        """Bloqueia até que todas as escritas enfileiradas tenham sido aplicadas."""
+        self._fila.join()
+
+    def fechar(self):
+        """
+        Aplica as escritas pendentes e encerra a thread escritora.
+        Depois disso `inserir` e `deletar` lançam RuntimeError.
+        """
+        with self._trava_fila:
+            if self._fechada:
+                return
+            self._fechada = True
+            self._fila.put(self._FIM)
+        self._escritor.join()
+
+    # Leituras --------------------------
+
+    def obter_profundidade_no(self, chave):
+        self._trava.adquirir_leitura()
+        try:
+            return self.arvore.obter_profundidade_no(chave)
+        finally:
+            self._trava.liberar_leitura()
+
+    def encontrar_nos_intervalo(self, chave1, chave2):
+        self._trava.adquirir_leitura()
+        try:
+            return self.arvore.encontrar_nos_intervalo(chave1, chave2)
+        finally:
+            self._trava.liberar_leitura()
+
+
+class ArvoreAVLAssincrona:
+    """
+    Fachada asyncio para a ArvoreAVLConcorrente.
+    Leituras rodam no executor padrão do loop; escritas aguardam o Future da fila.
+    """
+    def __init__(self, arvore_concorrente=None):
+        self.concorrente = arvore_concorrente if arvore_concorrente is not None else ArvoreAVLConcorrente()
+
+    async def inserir(self, chave):
+        await asyncio.wrap_future(self.concorrente.inserir(chave))
+
+    async def deletar(self, chave):
+        await asyncio.wrap_future(self.concorrente.deletar(chave))
+
+    async def obter_profundidade_no(self, chave):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.concorrente.obter_profundidade_no, chave)
+
+    async def encontrar_nos_intervalo(self, chave1, chave2):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.concorrente.encontrar_nos_intervalo, chave1, chave2)
+
+    async def descarregar(self):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.concorrente.descarregar)
+
+    async def fechar(self):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.concorrente.fechar)
+
+
+# Verifica recursivamente as propriedades de BST e AVL; retorna a altura da subárvore.
+def verificar_avl(no, minimo=None, maximo=None):
+    if no is None:
+        return 0
+    assert minimo is None or no.chave > minimo, "Propriedade de BST violada"
+    assert maximo is None or no.chave < maximo, "Propriedade de BST violada"
+    altura_esq = verificar_avl(no.esquerda, minimo, no.chave)
+    altura_dir = verificar_avl(no.direita, no.chave, maximo)
+    assert abs(altura_esq - altura_dir) <= 1, "Fator de balanceamento fora de [-1, 1]"
+    assert no.altura == 1 + max(altura_esq, altura_dir), "Altura armazenada incorreta"
+    return no.altura
+
+
+# Teste de estresse: cada thread insere sua faixa de chaves, remove metade e faz leituras no meio.
+def teste_estresse(num_threads=8, chaves_por_thread=2000):
+    arvore = ArvoreAVLConcorrente()
+
+    def trabalhador(indice):
+        base = indice * chaves_por_thread
+        chaves = list(range(base, base + chaves_por_thread))
+        random.shuffle(chaves)
+        futuros = [arvore.inserir(chave) for chave in chaves]
+        for futuro in futuros:
+            futuro.result()
+        for chave in chaves[::2]:
+            arvore.deletar(chave)
+        for chave in chaves[:100]:
+            arvore.obter_profundidade_no(chave)
+            arvore.encontrar_nos_intervalo(chave, chave + 50)
+
+    threads = [threading.Thread(target=trabalhador, args=(i,)) for i in range(num_threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    arvore.fechar()
+
+    verificar_avl(arvore.arvore.raiz)
+    restantes = arvore.encontrar_nos_intervalo(0, num_threads * chaves_por_thread)
+    assert len(restantes) == num_threads * chaves_por_thread // 2, "Número de chaves restantes incorreto"
+    assert restantes == sorted(restantes)
+    print(f"Teste de estresse OK: {num_threads} threads, {len(restantes)} chaves restantes.")
+
+
+# Mede a vazão (operações/s) de uma carga mista de leituras e escritas para cada número de threads.
+def benchmark(lista_threads=(1, 2, 4, 8), ops_por_thread=5000, fracao_escrita=0.1, tamanho_inicial=10000):
+    print(f"{'threads':>8} {'ops/s':>12}")
+    for num_threads in lista_threads:
+        arvore = ArvoreAVLConcorrente()
+        for chave in range(tamanho_inicial):
+            arvore.inserir(chave)
+        arvore.descarregar()
+
+        def trabalhador(indice):
+            rng = random.Random(indice)
+            proxima = tamanho_inicial + indice * ops_por_thread
+            for _ in range(ops_por_thread):
+                if rng.random() < fracao_escrita:
+                    arvore.inserir(proxima)
+                    proxima += 1
+                elif rng.random() < 0.5:
+                    arvore.obter_profundidade_no(rng.randrange(tamanho_inicial))
+                else:
+                    inicio = rng.randrange(tamanho_inicial)
+                    arvore.encontrar_nos_intervalo(inicio, inicio + 20)
+
+        threads = [threading.Thread(target=trabalhador, args=(i,)) for i in range(num_threads)]
+        inicio = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        arvore.fechar()
+        decorrido = time.perf_counter() - inicio
+        print(f"{num_threads:>8} {num_threads * ops_por_thread / decorrido:>12.0f}")
+
+
+async def _demo_assincrona():
+    arvore = ArvoreAVLAssincrona()
+    await asyncio.gather(*(arvore.inserir(chave) for chave in [9, 5, 10, 0, 6, 11, -1, 1, 2]))
+    await arvore.deletar(10)
+    print(f"Intervalo [1, 9]: {await arvore.encontrar_nos_intervalo(1, 9)}")
+    print(f"Profundidade do nó 6: {await arvore.obter_profundidade_no(6)}")
+    await arvore.fechar()
+
+
+if __name__ == "__main__":
+    print("\n--- ÁRVORE AVL CONCORRENTE ---")
+
+    print("\n--- 1. Fachada asyncio ---")
+    asyncio.run(_demo_assincrona())
+
+    print("\n--- 2. Teste de estresse ---")
+    teste_estresse()
+
+    print("\n--- 3. Benchmark de vazão por número de threads ---")
+    benchmark()
@@ -0,0 +1,244 @@
+import heapq
+import multiprocessing as mp
+import os
+import random
+import time
+from bisect import bisect_right
+
+from atividade_5 import ArvoreAVL
+
+
+# Laço executado em cada processo de partição. Mantém uma ArvoreAVL própria e o seu tamanho,
+# e responde a cada comando com ("ok", resultado, tamanho) ou ("erro", excecao, tamanho).
+def _trabalhador_particao(conexao):
+    arvore = ArvoreAVL()
+    tamanho = 0
+    while True:
+        comando, args = conexao.recv()
+        if comando == "encerrar":
+            conexao.close()
+            return
+        try:
+            resultado = None
+            if comando == "inserir":
+                arvore.inserir(args)
+                tamanho += 1
+            elif comando == "deletar":
+                if arvore.obter_profundidade_no(args) != -1:
+                    arvore.deletar(args)
+                    tamanho -= 1
+            elif comando == "inserir_lote":
+                # Aplica todas as chaves possíveis e devolve o primeiro erro encontrado, se houver.
+                for chave in args:
+                    try:
+                        arvore.inserir(chave)
+                        tamanho += 1
+                    except ValueError as e:
+                        resultado = resultado or e
+            elif comando == "profundidade":
+                resultado = arvore.obter_profundidade_no(args)
+            elif comando == "intervalo":
+                resultado = arvore.encontrar_nos_intervalo(*args)
+            elif comando == "chaves":
+                resultado = arvore.percurso_em_ordem()
+            elif comando == "carregar":
+                arvore.carregar_ordenadas(args)
+                tamanho = len(args)
+            else:
+                raise ValueError(f"Comando desconhecido: {comando}")
+            conexao.send(("ok", resultado, tamanho))
+        except Exception as e:
+            conexao.send(("erro", e, tamanho))
+
+
+class IndiceAVLParticionado:
+    """
+    Índice AVL particionado entre vários processos, cada um com a sua ArvoreAVL.
+
+    No modo "intervalo" o espaço de chaves é dividido por `fronteiras` (a partição i
+    guarda as chaves em [fronteiras[i-1], fronteiras[i])) e as fronteiras são
+    recalculadas quando a maior partição passa de `fator_desequilibrio` vezes a menor.
+    No modo "hash" a partição é hash(chave) % num_particoes e não há rebalanceamento.
+    """
+    def __init__(self, num_particoes=None, fronteiras=None, modo="intervalo",
+                 fator_desequilibrio=2.0, minimo_rebalanceamento=1024):
+        if modo not in ("intervalo", "hash"):
+            raise ValueError("O modo deve ser 'intervalo' ou 'hash'.")
+        self.num_particoes = num_particoes or os.cpu_count() or 1
+        if fronteiras is not None and len(fronteiras) != self.num_particoes - 1:
+            raise ValueError("São necessárias num_particoes - 1 fronteiras.")
+        self.modo = modo
+        # Sem fronteiras iniciais tudo vai para a partição 0 até o primeiro rebalanceamento.
+        self.fronteiras = sorted(fronteiras) if fronteiras is not None else []
+        self.fator_desequilibrio = fator_desequilibrio
+        self.minimo_rebalanceamento = minimo_rebalanceamento
+        self.tamanhos = [0] * self.num_particoes
+        self._conexoes = []
+        self._processos = []
+        for _ in range(self.num_particoes):
+            local, remota = mp.Pipe()
+            processo = mp.Process(target=_trabalhador_particao, args=(remota,), daemon=True)
+            processo.start()
+            remota.close()
+            self._conexoes.append(local)
+            self._processos.append(processo)
+
+    # Comunicação --------------------------
+
+    def _particao(self, chave):
+        if self.modo == "hash":
+            return hash(chave) % self.num_particoes
+        return bisect_right(self.fronteiras, chave)
+
+    def _enviar(self, indice, comando, args=None):
+        self._conexoes[indice].send((comando, args))
+
+    def _receber(self, indice):
+        estado, resultado, tamanho = self._conexoes[indice].recv()
+        self.tamanhos[indice] = tamanho
+        if estado == "erro":
+            raise resultado
+        return resultado
+
+    def _chamar(self, indice, comando, args=None):
+        self._enviar(indice, comando, args)
+        return self._receber(indice)
+
+    def _espalhar(self, comandos):
+        """Envia {indice: (comando, args)} a todas as partições antes de esperar as respostas."""
+        for indice, (comando, args) in comandos.items():
+            self._enviar(indice, comando, args)
+        resultados = {}
+        erro = None
+        for indice in comandos:
+            try:
+                resultados[indice] = self._receber(indice)
+            except Exception as e:
+                erro = erro or e
+        if erro is not None:
+            raise erro
+        return resultados
+
+    # Operações --------------------------
+
+    def inserir(self, chave):
+        self._chamar(self._particao(chave), "inserir", chave)
+        self._verificar_desequilibrio()
+
+    def deletar(self, chave):
+        self._chamar(self._particao(chave), "deletar", chave)
+        self._verificar_desequilibrio()
+
+    def inserir_lote(self, chaves):
+        """
+        Insere várias chaves, processando as partições em paralelo.
+        Chaves duplicadas são ignoradas e o primeiro ValueError é lançado ao final.
+        """
+        grupos = {}
+        for chave in chaves:
+            grupos.setdefault(self._particao(chave), []).append(chave)
+        resultados = self._espalhar({i: ("inserir_lote", grupo) for i, grupo in grupos.items()})
+        self._verificar_desequilibrio()
+        for erro in resultados.values():
+            if erro is not None:
+                raise erro
+
+    def obter_profundidade_no(self, chave):
+        """Profundidade da chave dentro da árvore da sua partição, ou -1 se não existir."""
+        return self._chamar(self._particao(chave), "profundidade", chave)
+
+    def encontrar_nos_intervalo(self, chave1, chave2):
+        if self.modo == "hash":
+            particoes = range(self.num_particoes)
+        else:
+            particoes = range(self._particao(chave1), self._particao(chave2) + 1)
+        resultados = self._espalhar({i: ("intervalo", (chave1, chave2)) for i in particoes})
+        return list(heapq.merge(*(resultados[i] for i in particoes)))
+
+    def __len__(self):
+        return sum(self.tamanhos)
+
+    # Rebalanceamento --------------------------
+
+    def _verificar_desequilibrio(self):
+        if self.modo != "intervalo" or self.num_particoes == 1:
+            return
+        if len(self) < self.minimo_rebalanceamento:
+            return
+        # Compara com a menor partição e não com a média: com poucas partições nenhuma
+        # pode passar de fator * média, já que a média inclui a própria partição grande.
+        if max(self.tamanhos) > self.fator_desequilibrio * min(self.tamanhos):
+            self.rebalancear()
+
+    def rebalancear(self):
+        """
+        Recalcula as fronteiras pelos quantis das chaves atuais e recarrega cada partição
+        com a sua nova faixa. Custa O(n) em transferência entre processos.
+        """
+        if self.modo != "intervalo":
+            return
+        todas = self._espalhar({i: ("chaves", None) for i in range(self.num_particoes)})
+        chaves = [chave for i in range(self.num_particoes) for chave in todas[i]]
+        total = len(chaves)
+        if total < self.num_particoes:
+            return
+        cortes = [i * total // self.num_particoes for i in range(self.num_particoes + 1)]
+        self.fronteiras = [chaves[c] for c in cortes[1:-1]]
+        self._espalhar({i: ("carregar", chaves[cortes[i]:cortes[i + 1]]) for i in range(self.num_particoes)})
+
+    def fechar(self):
+        for indice, processo in enumerate(self._processos):
+            if processo.is_alive():
+                self._enviar(indice, "encerrar")
+            processo.join()
+            self._conexoes[indice].close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+# Mede a vazão de inserção em lote com 1..max_particoes processos, contra uma única ArvoreAVL no processo atual.
+def benchmark_escalabilidade(max_particoes=None, total_chaves=200000, tamanho_lote=20000):
+    max_particoes = max_particoes or os.cpu_count() or 1
+    chaves = random.sample(range(total_chaves * 10), total_chaves)
+
+    inicio = time.perf_counter()
+    arvore = ArvoreAVL()
+    for chave in chaves:
+        arvore.inserir(chave)
+    referencia = time.perf_counter() - inicio
+    print(f"{'partições':>10} {'chaves/s':>12} {'speedup':>8}")
+    print(f"{'local':>10} {total_chaves / referencia:>12.0f} {1.0:>8.2f}")
+
+    for num_particoes in range(1, max_particoes + 1):
+        # Fronteiras uniformes e rebalanceamento desligado, para que ele não entre na medição.
+        passo = total_chaves * 10 // num_particoes
+        fronteiras = [i * passo for i in range(1, num_particoes)]
+        with IndiceAVLParticionado(num_particoes, fronteiras=fronteiras,
+                                   fator_desequilibrio=float("inf")) as indice:
+            inicio = time.perf_counter()
+            for i in range(0, total_chaves, tamanho_lote):
+                indice.inserir_lote(chaves[i:i + tamanho_lote])
+            decorrido = time.perf_counter() - inicio
+        print(f"{num_particoes:>10} {total_chaves / decorrido:>12.0f} {referencia / decorrido:>8.2f}")
+
+
+if __name__ == "__main__":
+    print("\n--- ÍNDICE AVL PARTICIONADO ---")
+
+    print("\n--- 1. Operações básicas com 3 partições ---")
+    with IndiceAVLParticionado(3, minimo_rebalanceamento=8) as indice:
+        for chave in [9, 5, 10, 0, 6, 11, -1, 1, 2]:
+            indice.inserir(chave)
+        indice.deletar(10)
+        indice.deletar(11)
+        print(f"Fronteiras após rebalanceamento: {indice.fronteiras}")
+        print(f"Tamanhos das partições: {indice.tamanhos}")
+        print(f"Nós no intervalo [1, 9]: {indice.encontrar_nos_intervalo(1, 9)}")
+        print(f"Profundidade do nó 6 na sua partição: {indice.obter_profundidade_no(6)}")
+
+    print("\n--- 2. Benchmark de escalabilidade ---")
+    benchmark_escalabilidade()
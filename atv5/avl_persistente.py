@@ -0,0 +1,242 @@
+import json
+import os
+import random
+import tempfile
+import time
+
+from atividade_5 import ArvoreAVL
+
+
+class ArvoreAVLPersistente:
+    """
+    ArvoreAVL durável: cada inserção/deleção é registrada num log append-only
+    como [lsn, operacao, chave] e, periodicamente, o conteúdo inteiro é gravado
+    num snapshot compacto com as chaves em ordem.
+
+    O log é gravado em grupos: as entradas ficam num buffer e só passam pelo
+    fsync a cada `tamanho_grupo` operações ou numa chamada a `sincronizar()`.
+    Cada grupo vira uma única linha JSON. Operações ainda no buffer podem ser
+    perdidas numa queda.
+
+    A recuperação carrega o snapshot em tempo linear (`carregar_ordenadas`) e
+    reaplica apenas as entradas do log com lsn maior que o do snapshot.
+
+    As chaves precisam ser int, float ou str: são os tipos que voltam idênticos
+    do JSON (uma tupla, por exemplo, voltaria como lista). Outros tipos são
+    rejeitados com TypeError antes de a árvore ser alterada.
+    """
+    TIPOS_CHAVE = (int, float, str)
+
+    ARQUIVO_SNAPSHOT = "snapshot.json"
+    ARQUIVO_LOG = "log.jsonl"
+
+    def __init__(self, diretorio, tamanho_grupo=128, intervalo_checkpoint=100000):
+        os.makedirs(diretorio, exist_ok=True)
+        self.diretorio = diretorio
+        self.tamanho_grupo = tamanho_grupo
+        self.intervalo_checkpoint = intervalo_checkpoint
+        self.arvore = ArvoreAVL()
+        self._caminho_snapshot = os.path.join(diretorio, self.ARQUIVO_SNAPSHOT)
+        self._caminho_log = os.path.join(diretorio, self.ARQUIVO_LOG)
+        self._lsn = 0
+        self._buffer = []
+        self._ops_desde_checkpoint = 0
+        self._recuperar()
+        self._log = open(self._caminho_log, "a", encoding="utf-8")
+
+    # Recuperação --------------------------
+
+    def _recuperar(self):
+        lsn_snapshot = 0
+        if os.path.exists(self._caminho_snapshot):
+            with open(self._caminho_snapshot, encoding="utf-8") as f:
+                snapshot = json.load(f)
+            lsn_snapshot = snapshot["lsn"]
+            self.arvore.carregar_ordenadas(snapshot["chaves"])
+        self._lsn = lsn_snapshot
+
+        if not os.path.exists(self._caminho_log):
+            return
+        valido_ate = 0
+        with open(self._caminho_log, "rb") as f:
+            linhas = f.readlines()
+        for numero, linha in enumerate(linhas, 1):
+            # Só conta como gravada a linha terminada em "\n"; sem ele o próximo grupo
+            # seria anexado à mesma linha e ela deixaria de ser JSON válido.
+            grupo = None
+            if linha.endswith(b"\n"):
+                try:
+                    grupo = json.loads(linha)
+                except ValueError:
+                    pass
+            if grupo is None:
+                if numero < len(linhas):
+                    raise ValueError(f"Log corrompido na linha {numero} de {self._caminho_log}.")
+                # Linha incompleta no fim do log: a queda aconteceu no meio da escrita do grupo.
+                break
+            valido_ate += len(linha)
+            for lsn, operacao, chave in grupo:
+                if lsn <= lsn_snapshot:
+                    continue
+                if operacao == "i":
+                    self.arvore.inserir(chave)
+                else:
+                    self.arvore.deletar(chave)
+                self._lsn = lsn
+                self._ops_desde_checkpoint += 1
+        if valido_ate != os.path.getsize(self._caminho_log):
+            with open(self._caminho_log, "r+b") as f:
+                f.truncate(valido_ate)
+
+    # Escritas --------------------------
+
+    def inserir(self, chave):
+        linha = self._codificar("i", chave)
+        self.arvore.inserir(chave)
+        self._registrar(linha)
+
+    def deletar(self, chave):
+        linha = self._codificar("d", chave)
+        # Deleções de chaves inexistentes não alteram a árvore e não vão para o log.
+        if self.arvore.obter_profundidade_no(chave) == -1:
+            return
+        self.arvore.deletar(chave)
+        self._registrar(linha)
+
+    def _codificar(self, operacao, chave):
+        # Codifica a entrada antes de mexer na árvore: uma chave que não pode ir para o
+        # log é rejeitada aqui, e não num sincronizar() posterior.
+        if type(chave) not in self.TIPOS_CHAVE:
+            raise TypeError(f"Chave do tipo {type(chave).__name__} não é suportada; use int, float ou str.")
+        return json.dumps([self._lsn + 1, operacao, chave])
+
+    def _registrar(self, linha):
+        self._lsn += 1
+        self._buffer.append(linha)
+        self._ops_desde_checkpoint += 1
+        if len(self._buffer) >= self.tamanho_grupo:
+            self.sincronizar()
+        if self._ops_desde_checkpoint >= self.intervalo_checkpoint:
+            self.checkpoint()
+
+    def sincronizar(self):
+        """Grava o buffer no log e faz fsync; depois disso todas as operações são duráveis."""
+        if not self._buffer:
+            return
+        self._log.write("[" + ",".join(self._buffer) + "]\n")
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self._buffer = []
+
+    def checkpoint(self):
+        """
+        Grava um snapshot com todas as chaves e descarta o log.
+        O snapshot é escrito num arquivo temporário e trocado atomicamente; se a queda
+        ocorrer antes de o log ser truncado, as entradas antigas são ignoradas pelo lsn.
+        """
+        self.sincronizar()
+        temporario = self._caminho_snapshot + ".tmp"
+        with open(temporario, "w", encoding="utf-8") as f:
+            json.dump({"lsn": self._lsn, "chaves": self.arvore.percurso_em_ordem()}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, self._caminho_snapshot)
+        self._sincronizar_diretorio()
+
+        self._log.close()
+        self._log = open(self._caminho_log, "w", encoding="utf-8")
+        os.fsync(self._log.fileno())
+        self._ops_desde_checkpoint = 0
+
+    def _sincronizar_diretorio(self):
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(self.diretorio, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def fechar(self):
+        self.sincronizar()
+        self._log.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    # Leituras --------------------------
+
+    def obter_profundidade_no(self, chave):
+        return self.arvore.obter_profundidade_no(chave)
+
+    def encontrar_nos_intervalo(self, chave1, chave2):
+        return self.arvore.encontrar_nos_intervalo(chave1, chave2)
+
+
+# Compara o tempo de inserção numa ArvoreAVL comum com a versão persistente para vários tamanhos de grupo.
+def benchmark_log(total_chaves=50000, tamanhos_grupo=(1, 32, 512)):
+    chaves = random.sample(range(total_chaves * 10), total_chaves)
+
+    inicio = time.perf_counter()
+    arvore = ArvoreAVL()
+    for chave in chaves:
+        arvore.inserir(chave)
+    referencia = time.perf_counter() - inicio
+    print(f"{'grupo':>8} {'ops/s':>12} {'sobrecarga':>11}")
+    print(f"{'memória':>8} {total_chaves / referencia:>12.0f} {'-':>11}")
+
+    for tamanho_grupo in tamanhos_grupo:
+        with tempfile.TemporaryDirectory() as diretorio:
+            inicio = time.perf_counter()
+            with ArvoreAVLPersistente(diretorio, tamanho_grupo=tamanho_grupo,
+                                      intervalo_checkpoint=total_chaves * 2) as arvore:
+                for chave in chaves:
+                    arvore.inserir(chave)
+            decorrido = time.perf_counter() - inicio
+        sobrecarga = (decorrido / referencia - 1) * 100
+        print(f"{tamanho_grupo:>8} {total_chaves / decorrido:>12.0f} {sobrecarga:>10.0f}%")
+
+
+# Mede o tempo de recuperação a partir de snapshot + cauda do log contra a reaplicação do log inteiro.
+def benchmark_recuperacao(total_chaves=100000, cauda=1000):
+    chaves = random.sample(range(total_chaves * 10), total_chaves)
+    cenarios = [
+        ("log completo", total_chaves * 2),
+        (f"snapshot + {cauda}", total_chaves - cauda),
+    ]
+    print(f"{'cenário':>18} {'recuperação (s)':>16}")
+    for nome, intervalo_checkpoint in cenarios:
+        with tempfile.TemporaryDirectory() as diretorio:
+            with ArvoreAVLPersistente(diretorio, tamanho_grupo=1024,
+                                      intervalo_checkpoint=intervalo_checkpoint) as arvore:
+                for chave in chaves:
+                    arvore.inserir(chave)
+            inicio = time.perf_counter()
+            with ArvoreAVLPersistente(diretorio) as recuperada:
+                decorrido = time.perf_counter() - inicio
+                assert len(recuperada.encontrar_nos_intervalo(min(chaves), max(chaves))) == total_chaves
+        print(f"{nome:>18} {decorrido:>16.3f}")
+
+
+if __name__ == "__main__":
+    print("\n--- ÁRVORE AVL PERSISTENTE ---")
+
+    print("\n--- 1. Recuperação após reabrir ---")
+    with tempfile.TemporaryDirectory() as diretorio:
+        with ArvoreAVLPersistente(diretorio, tamanho_grupo=4, intervalo_checkpoint=6) as arvore:
+            for chave in [9, 5, 10, 0, 6, 11, -1, 1, 2]:
+                arvore.inserir(chave)
+            for chave in [10, 11]:
+                arvore.deletar(chave)
+        with ArvoreAVLPersistente(diretorio) as arvore:
+            print(f"Nós no intervalo [1, 9]: {arvore.encontrar_nos_intervalo(1, 9)}")
+            print(f"Profundidade do nó 6: {arvore.obter_profundidade_no(6)}")
+
+    print("\n--- 2. Sobrecarga do log ---")
+    benchmark_log()
+
+    print("\n--- 3. Tempo de recuperação ---")
+    benchmark_recuperacao()